@@ -13,7 +13,11 @@ from fugue.dataframe.iterable_dataframe import IterableDataFrame
 from fugue.dataframe.pandas_dataframe import PandasDataFrame
 from fugue.dataframe.utils import to_local_bounded_df, to_local_df
 from fugue.execution.execution_engine import ExecutionEngine, SQLEngine
-from fugue.execution.native_execution_engine import NativeExecutionEngine, SqliteEngine
+from fugue.execution.native_execution_engine import (
+    DuckDBEngine,
+    NativeExecutionEngine,
+    SqliteEngine,
+)
 from fugue.extensions.creator import Creator, creator
 from fugue.extensions.outputter import Outputter, outputter
 from fugue.extensions.processor import Processor, processor
@@ -1,9 +1,11 @@
 import pathlib
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 import pandas as pd
-from fugue.dataframe import LocalBoundedDataFrame, LocalDataFrame, PandasDataFrame
+import pyarrow as pa
+import pyarrow.parquet as pq
+from fugue.dataframe import IterableDataFrame, LocalDataFrame, PandasDataFrame
 from triad.collections.fs import FileSystem
 from triad.collections.schema import Schema
 from triad.exceptions import InvalidOperationError
@@ -52,12 +54,24 @@ def load_df(
     format_hint: Optional[str] = None,
     columns: Any = None,
     fs: Optional[FileSystem] = None,
+    chunk_size: Optional[int] = None,
     **kwargs: Any,
-) -> LocalBoundedDataFrame:
+) -> LocalDataFrame:
     if isinstance(uri, str):
         fp = [FileParser(uri, format_hint)]
     else:
         fp = [FileParser(u, format_hint) for u in uri]
+    if chunk_size is not None:
+        fmt = fp[0].file_format
+        assert_or_throw(
+            all(f.file_format == fmt for f in fp),
+            NotImplementedError("can't stream mixed formats"),
+        )
+        assert_or_throw(
+            fmt in _FORMAT_LOAD_STREAM,
+            NotImplementedError(f"chunked load is not supported for {fmt}"),
+        )
+        return _FORMAT_LOAD_STREAM[fmt](fp, columns, chunk_size, **kwargs)
     dfs: List[pd.DataFrame] = []
     schema: Any = None
     for f in fp:
@@ -107,6 +121,34 @@ def _load_parquet(
     return pdf, schema
 
 
+def _load_parquet_stream(
+    fp: List[FileParser], columns: Any, chunk_size: int, **kwargs: Any
+) -> IterableDataFrame:
+    names: Optional[List[str]] = None
+    if columns is None:
+        schema = Schema(pq.ParquetFile(fp[0].uri).schema_arrow)
+    elif isinstance(columns, list):  # column names
+        schema = Schema(pq.ParquetFile(fp[0].uri).schema_arrow).extract(columns)
+        names = columns
+    else:
+        schema = Schema(columns)
+        names = schema.names
+
+    def _iter_rows() -> Iterable[Any]:
+        for f in fp:
+            pf = pq.ParquetFile(f.uri)
+            for batch in pf.iter_batches(
+                batch_size=chunk_size, columns=names, **kwargs
+            ):
+                if names is not None:
+                    batch = batch.select(names)
+                cols = [batch.column(i).to_pylist() for i in range(batch.num_columns)]
+                for row in zip(*cols):
+                    yield list(row)
+
+    return IterableDataFrame(_iter_rows(), schema)
+
+
 def _save_csv(df: LocalDataFrame, p: FileParser, **kwargs: Any) -> None:
     df.as_pandas().to_csv(p.uri, **{"index": False, "header": False, **kwargs})
 
@@ -119,13 +161,22 @@ def _load_csv(
     if "header" in kw:
         del kw["header"]
     if str(header) in ["True", "0"]:
+        if columns is not None and not isinstance(columns, list):
+            schema = Schema(columns)
+            pdf = pd.read_csv(
+                p.uri,
+                **{
+                    "index_col": False,
+                    "header": 0,
+                    "dtype": _schema_to_csv_dtype(schema),
+                    **kw,
+                },
+            )
+            return pdf[schema.names], schema
         pdf = pd.read_csv(p.uri, **{"index_col": False, "header": 0, **kw})
         if columns is None:
             return pdf, None
-        if isinstance(columns, list):  # column names
-            return pdf[columns], None
-        schema = Schema(columns)
-        return pdf[schema.names], schema
+        return pdf[columns], None  # column names
     if header is None or str(header) == "False":
         if columns is None:
             raise InvalidOperationError("columns must be set if without header")
@@ -136,13 +187,71 @@ def _load_csv(
             return pdf, None
         schema = Schema(columns)
         pdf = pd.read_csv(
-            p.uri, **{"index_col": False, "header": None, "names": schema.names, **kw}
+            p.uri,
+            **{
+                "index_col": False,
+                "header": None,
+                "names": schema.names,
+                "dtype": _schema_to_csv_dtype(schema),
+                **kw,
+            },
         )
         return pdf, schema
     else:
         raise NotImplementedError(f"{header} is not supported")
 
 
+def _load_csv_stream(
+    fp: List[FileParser], columns: Any, chunk_size: int, **kwargs: Any
+) -> IterableDataFrame:
+    kw = dict(kwargs)
+    header = kw.pop("header", False)
+    assert_or_throw(
+        columns is not None and not isinstance(columns, list),
+        InvalidOperationError("columns must be a schema to stream csv"),
+    )
+    schema = Schema(columns)
+    args: Dict[str, Any] = {"index_col": False, "dtype": _schema_to_csv_dtype(schema)}
+    if str(header) in ["True", "0"]:
+        args["header"] = 0
+    elif header is None or str(header) == "False":
+        args["header"] = None
+        args["names"] = schema.names
+    else:
+        raise NotImplementedError(f"{header} is not supported")
+
+    def _iter_rows() -> Iterable[Any]:
+        for f in fp:
+            for chunk in pd.read_csv(f.uri, chunksize=chunk_size, **{**args, **kw}):
+                for row in chunk[schema.names].itertuples(index=False, name=None):
+                    # nullable pandas dtypes produce pd.NA scalars, which
+                    # downstream type conversion doesn't understand
+                    yield [None if v is pd.NA else v for v in row]
+
+    return IterableDataFrame(_iter_rows(), schema)
+
+
+def _schema_to_csv_dtype(schema: Schema) -> Dict[str, Any]:
+    """Column type hints for the pandas csv reader, so it can skip the
+    type inference pass. Temporal and nested types are left out because
+    ``read_csv`` can't parse them through ``dtype``.
+    """
+    dtype: Dict[str, Any] = {}
+    for f in schema.pa_schema:
+        t = f.type
+        if pa.types.is_integer(t):
+            # nullable pandas integers, the numpy ones raise on empty cells
+            prefix = "UInt" if pa.types.is_unsigned_integer(t) else "Int"
+            dtype[f.name] = prefix + str(t.bit_width)
+        elif pa.types.is_boolean(t):
+            dtype[f.name] = "boolean"
+        elif pa.types.is_floating(t):
+            dtype[f.name] = t.to_pandas_dtype()
+        elif pa.types.is_string(t):
+            dtype[f.name] = str
+    return dtype
+
+
 def _save_json(df: LocalDataFrame, p: FileParser, **kwargs: Any) -> None:
     df.as_pandas().to_json(p.uri, **kwargs)
 
@@ -173,6 +282,11 @@ _FORMAT_LOAD: Dict[str, Callable[..., Tuple[pd.DataFrame, Any]]] = {
     "json": _load_json,
 }
 
+_FORMAT_LOAD_STREAM: Dict[str, Callable[..., IterableDataFrame]] = {
+    "csv": _load_csv_stream,
+    "parquet": _load_parquet_stream,
+}
+
 _FORMAT_SAVE: Dict[str, Callable] = {
     "csv": _save_csv,
     "parquet": _save_parquet,
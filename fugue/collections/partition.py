@@ -1,5 +1,5 @@
 import json
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from triad.collections.dict import IndexedOrderedDict, ParamDict
 from triad.collections.schema import Schema
@@ -66,6 +66,8 @@ class PartitionSpec(object):
         # TODO: currently, size limit not in use
         self._size_limit = to_size(p.get("size_limit", "0"))
         self._row_limit = p.get("row_limit", 0)
+        self._presort_keys: Optional[List[str]] = None
+        self._presort_asc: Optional[List[bool]] = None
 
     @property
     def empty(self) -> bool:
@@ -123,6 +125,20 @@ class PartitionSpec(object):
         """
         return self._presort
 
+    @property
+    def presort_keys(self) -> List[str]:
+        """Get presort keys in order, lazily cached"""
+        if self._presort_keys is None:
+            self._presort_keys = list(self._presort.keys())
+        return self._presort_keys
+
+    @property
+    def presort_asc(self) -> List[bool]:
+        """Get the ascending flags of :meth:`~.presort_keys`, lazily cached"""
+        if self._presort_asc is None:
+            self._presort_asc = list(self._presort.values())
+        return self._presort_asc
+
     @property
     def presort_expr(self) -> str:
         """Get normalized presort expression
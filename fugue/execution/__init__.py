@@ -1,3 +1,7 @@
 # flake8: noqa
 from fugue.execution.execution_engine import ExecutionEngine, SQLEngine
-from fugue.execution.native_execution_engine import NativeExecutionEngine, SqliteEngine
+from fugue.execution.native_execution_engine import (
+    DuckDBEngine,
+    NativeExecutionEngine,
+    SqliteEngine,
+)
@@ -234,6 +234,49 @@ class ExecutionEngine(ABC):
         """
         raise NotImplementedError
 
+    def join_many(
+        self,
+        dfs: List[DataFrame],
+        how: str,
+        on: List[str] = _DEFAULT_JOIN_KEYS,
+        metadata: Any = None,
+    ) -> DataFrame:
+        """Join multiple dataframes, default implementation is a left fold
+        of :meth:`~.join`. Engines able to build a single multi-way join plan
+        should override this to avoid materializing intermediate results.
+
+        :param dfs: dataframes to join, in order, must not be empty
+        :param how: can accept ``semi``, ``left_semi``, ``anti``, ``left_anti``,
+          ``inner``, ``left_outer``, ``right_outer``, ``full_outer``, ``cross``
+        :param on: it can always be inferred, but if you provide, it will be
+          validated against the inferred keys.
+        :param metadata: dict-like object to add to the result dataframe,
+          defaults to None
+        :return: the joined dataframe
+
+        :Notice:
+
+        Please read :func:`this <fugue.dataframe.utils.get_join_schemas>`
+        """
+        assert_or_throw(len(dfs) > 0, ValueError("dfs can't be empty"))
+        if len(dfs) == 1:
+            res = self.to_df(dfs[0])
+            if metadata is not None:
+                # to_df returns the input itself when it's already engine
+                # compatible, so attach the metadata to a fresh wrapper
+                # sharing the underlying data, never to the caller's object
+                # (copy.copy can't do this: DataFrame.__copy__ returns self)
+                clone = res.__class__.__new__(res.__class__)
+                clone.__dict__.update(res.__dict__)
+                clone._metadata = ParamDict(metadata, deep=True)
+                clone._metadata.set_readonly()
+                res = clone
+            return res
+        df = dfs[0]
+        for i in range(1, len(dfs) - 1):
+            df = self.join(df, dfs[i], how=how, on=on)
+        return self.join(df, dfs[-1], how=how, on=on, metadata=metadata)
+
     @abstractmethod
     def union(
         self,
@@ -1,7 +1,10 @@
 import logging
-from typing import Any, Callable, List, Optional, Union
+from typing import Any, Callable, List, Optional, Tuple, Union
 
+import duckdb
+import numpy as np
 import pandas as pd
+from pandas.api.types import is_object_dtype, union_categoricals
 from fugue._utils.io import load_df, save_df
 from fugue.collections.partition import (
     EMPTY_PARTITION_SPEC,
@@ -9,6 +12,7 @@ from fugue.collections.partition import (
     PartitionSpec,
 )
 from fugue.dataframe import (
+    ArrayDataFrame,
     DataFrame,
     DataFrames,
     LocalBoundedDataFrame,
@@ -23,7 +27,6 @@ from fugue.execution.execution_engine import (
     SQLEngine,
 )
 from qpd_pandas.engine import PandasUtils
-from sqlalchemy import create_engine
 from triad.collections import Schema
 from triad.collections.dict import ParamDict
 from triad.collections.fs import FileSystem
@@ -31,7 +34,10 @@ from triad.utils.assertion import assert_or_throw
 
 
 class SqliteEngine(SQLEngine):
-    """Sqlite execution implementation.
+    """Sqlite style execution implementation, backed by
+    `DuckDB <https://duckdb.org/>`_ in-process SQL. Input dataframes are
+    registered as views (no copy) and the statement runs vectorized,
+    which is significantly faster than round-tripping through sqlite.
 
     :param execution_engine: the execution engine this sql engine will run on
     """
@@ -40,13 +46,24 @@ class SqliteEngine(SQLEngine):
         super().__init__(execution_engine)
 
     def select(self, dfs: DataFrames, statement: str) -> DataFrame:
-        sql_engine = create_engine("sqlite:///:memory:")
-        for k, v in dfs.items():
-            v.as_pandas().to_sql(k, sql_engine, if_exists="replace", index=False)
-        df = pd.read_sql_query(statement, sql_engine)
+        con = duckdb.connect()
+        try:
+            for k, v in dfs.items():
+                con.register(k, v.as_pandas())
+            df = con.execute(statement).fetch_df()
+        finally:
+            con.close()
         return PandasDataFrame(df)
 
 
+class DuckDBEngine(SqliteEngine):
+    """DuckDB in-process SQL execution implementation, the default
+    sql engine of :class:`~.NativeExecutionEngine`.
+
+    :param execution_engine: the execution engine this sql engine will run on
+    """
+
+
 class NativeExecutionEngine(ExecutionEngine):
     """The execution engine based on native python and pandas. This execution engine
     is mainly for prototyping and unit tests.
@@ -60,7 +77,8 @@ class NativeExecutionEngine(ExecutionEngine):
         super().__init__(conf)
         self._fs = FileSystem()
         self._log = logging.getLogger()
-        self._default_sql_engine = SqliteEngine(self)
+        self._default_sql_engine = DuckDBEngine(self)
+        self._pl_utils = PandasUtils()
 
     def __repr__(self) -> str:
         return "NativeExecutionEngine"
@@ -80,7 +98,7 @@ class NativeExecutionEngine(ExecutionEngine):
     @property
     def pl_utils(self) -> PandasUtils:
         """Pandas-like dataframe utils"""
-        return PandasUtils()
+        return self._pl_utils
 
     def stop(self) -> None:  # pragma: no cover
         return
@@ -116,21 +134,26 @@ class NativeExecutionEngine(ExecutionEngine):
             df = to_local_df(df)
             cursor.set(df.peek_array(), 0, 0)
             output_df = map_func(cursor, df)
-            assert_or_throw(
-                output_df.schema == output_schema,
-                f"map output {output_df.schema} mismatches given {output_schema}",
-            )
-            output_df._metadata = ParamDict(metadata, deep=True)
-            output_df._metadata.set_readonly()
+            # schema validation is on by default, can be turned off in
+            # perf sensitive pipelines with many small transforms
+            if self.conf.get_or_none("fugue.validate_schemas", bool) is not False:
+                assert_or_throw(
+                    output_df.schema == output_schema,
+                    f"map output {output_df.schema} mismatches given {output_schema}",
+                )
+            if isinstance(metadata, ParamDict) and metadata.readonly:
+                # common case: the same immutable metadata flows through
+                # many steps, no need to deep copy it every time
+                output_df._metadata = metadata
+            else:
+                output_df._metadata = ParamDict(metadata, deep=True)
+                output_df._metadata.set_readonly()
             return self.to_df(output_df)
-        presort = partition_spec.presort
-        presort_keys = list(presort.keys())
-        presort_asc = list(presort.values())
+        presort_keys = partition_spec.presort_keys
+        presort_asc = partition_spec.presort_asc
         output_schema = Schema(output_schema)
 
         def _map(pdf: pd.DataFrame) -> pd.DataFrame:
-            if len(presort_keys) > 0:
-                pdf = pdf.sort_values(presort_keys, ascending=presort_asc)
             input_df = PandasDataFrame(
                 pdf.reset_index(drop=True), df.schema, pandas_df_wrapper=True
             )
@@ -138,8 +161,11 @@ class NativeExecutionEngine(ExecutionEngine):
             output_df = map_func(cursor, input_df)
             return output_df.as_pandas()
 
-        result = self.pl_utils.safe_groupby_apply(
-            df.as_pandas(), partition_spec.partition_by, _map
+        pdf = df.as_pandas()
+        if pdf.shape[0] == 0:
+            return ArrayDataFrame([], output_schema, metadata)
+        result = _group_map(
+            pdf, partition_spec.partition_by, _map, presort_keys, presort_asc
         )
         return PandasDataFrame(result, output_schema, metadata)
 
@@ -158,11 +184,54 @@ class NativeExecutionEngine(ExecutionEngine):
         metadata: Any = None,
     ) -> DataFrame:
         key_schema, output_schema = get_join_schemas(df1, df2, how=how, on=on)
-        d = self.pl_utils.join(
-            df1.as_pandas(), df2.as_pandas(), join_type=how, on=key_schema.names
+        if how.lower() == "inner":
+            # merge by index: one index build per side, no key sorting,
+            # null keys dropped upfront to match SQL inner join semantics
+            keys = key_schema.names
+            left = df1.as_pandas().dropna(subset=keys).set_index(keys)
+            right = df2.as_pandas().dropna(subset=keys).set_index(keys)
+            d = left.join(right, how="inner", sort=False).reset_index()
+            return PandasDataFrame(d, output_schema, metadata)
+        # other join types keep qpd's null handling semantics
+        d1, d2, cat_keys = _narrow_join_keys(
+            df1.as_pandas(), df2.as_pandas(), key_schema.names
         )
+        d = self.pl_utils.join(d1, d2, join_type=how, on=key_schema.names)
+        for k in cat_keys:  # restore original values of categorized keys
+            if k in d.columns:
+                s = d[k].astype(object)
+                # the category cast-back leaves float nan where the
+                # original object column held None
+                d[k] = s.where(s.notna(), None)
         return PandasDataFrame(d.reset_index(drop=True), output_schema, metadata)
 
+    def join_many(
+        self,
+        dfs: List[DataFrame],
+        how: str,
+        on: List[str] = _DEFAULT_JOIN_KEYS,
+        metadata: Any = None,
+    ) -> DataFrame:
+        if len(dfs) <= 2 or how.lower() != "inner":
+            return super().join_many(dfs, how, on=on, metadata=metadata)
+        key_schema, output_schema = get_join_schemas(dfs[0], dfs[1], how=how, on=on)
+        for i in range(2, len(dfs)):
+            ks, next_schema = get_join_schemas(
+                ArrayDataFrame([], output_schema), dfs[i], how=how, on=on
+            )
+            if ks != key_schema:  # keys vary between pairs, no single plan
+                return super().join_many(dfs, how, on=on, metadata=metadata)
+            output_schema = next_schema
+        # single multi-way plan: one index build per input, one output
+        # materialization; null keys never match in SQL inner joins so
+        # they are dropped upfront
+        keys = key_schema.names
+        indexed = [df.as_pandas().dropna(subset=keys).set_index(keys) for df in dfs]
+        d = indexed[0]
+        for r in indexed[1:]:
+            d = d.join(r, how="inner", sort=False)
+        return PandasDataFrame(d.reset_index(), output_schema, metadata)
+
     def union(
         self,
         df1: DataFrame,
@@ -173,8 +242,10 @@ class NativeExecutionEngine(ExecutionEngine):
         assert_or_throw(
             df1.schema == df2.schema, ValueError(f"{df1.schema} != {df2.schema}")
         )
-        d = self.pl_utils.union(df1.as_pandas(), df2.as_pandas(), unique=distinct)
-        return PandasDataFrame(d.reset_index(drop=True), df1.schema, metadata)
+        d = pd.concat([df1.as_pandas(), df2.as_pandas()], ignore_index=True, copy=False)
+        if distinct:
+            d = d.drop_duplicates(ignore_index=True)
+        return PandasDataFrame(d, df1.schema, metadata)
 
     def subtract(
         self,
@@ -189,7 +260,9 @@ class NativeExecutionEngine(ExecutionEngine):
         assert_or_throw(
             df1.schema == df2.schema, ValueError(f"{df1.schema} != {df2.schema}")
         )
-        d = self.pl_utils.except_df(df1.as_pandas(), df2.as_pandas(), unique=distinct)
+        cols = df1.schema.names
+        d1 = df1.as_pandas().drop_duplicates()
+        d = d1[~d1.set_index(cols).index.isin(df2.as_pandas().set_index(cols).index)]
         return PandasDataFrame(d.reset_index(drop=True), df1.schema, metadata)
 
     def intersect(
@@ -205,7 +278,11 @@ class NativeExecutionEngine(ExecutionEngine):
         assert_or_throw(
             df1.schema == df2.schema, ValueError(f"{df1.schema} != {df2.schema}")
         )
-        d = self.pl_utils.intersect(df1.as_pandas(), df2.as_pandas(), unique=distinct)
+        d = pd.merge(
+            df1.as_pandas().drop_duplicates(),
+            df2.as_pandas().drop_duplicates(),
+            how="inner",
+        )
         return PandasDataFrame(d.reset_index(drop=True), df1.schema, metadata)
 
     def distinct(
@@ -213,8 +290,8 @@ class NativeExecutionEngine(ExecutionEngine):
         df: DataFrame,
         metadata: Any = None,
     ) -> DataFrame:
-        d = self.pl_utils.drop_duplicates(df.as_pandas())
-        return PandasDataFrame(d.reset_index(drop=True), df.schema, metadata)
+        d = df.as_pandas().drop_duplicates(ignore_index=True)
+        return PandasDataFrame(d, df.schema, metadata)
 
     def load_df(
         self,
@@ -222,11 +299,11 @@ class NativeExecutionEngine(ExecutionEngine):
         format_hint: Any = None,
         columns: Any = None,
         **kwargs: Any,
-    ) -> LocalBoundedDataFrame:
-        return self.to_df(
-            load_df(
-                path, format_hint=format_hint, columns=columns, fs=self.fs, **kwargs
-            )
+    ) -> LocalDataFrame:
+        # when chunk_size is in kwargs, the result is an IterableDataFrame
+        # streaming through the file in chunks, so don't force it to be bounded
+        return load_df(
+            path, format_hint=format_hint, columns=columns, fs=self.fs, **kwargs
         )
 
     def save_df(
@@ -245,3 +322,94 @@ class NativeExecutionEngine(ExecutionEngine):
             )
         df = self.to_df(df)
         save_df(df, path, format_hint=format_hint, mode=mode, fs=self.fs, **kwargs)
+
+
+def _narrow_join_keys(
+    d1: pd.DataFrame, d2: pd.DataFrame, keys: List[str]
+) -> Tuple[pd.DataFrame, pd.DataFrame, List[str]]:
+    """Narrow the join key columns of ``d1`` and ``d2`` to cheaper common
+    dtypes before a pandas join: int64 keys fitting in int32 are downcast,
+    halving the hash key width, and object (string) keys are converted to
+    categoricals with unified categories so the join hashes integer codes
+    instead of python strings. Only the key columns are replaced, on
+    shallow copies, payload columns are untouched.
+
+    :param d1: the first pandas dataframe
+    :param d2: the second pandas dataframe
+    :param keys: join key column names
+    :return: the two (possibly shallow copied) dataframes, plus the keys
+      converted to categoricals, which the caller must cast back on the
+      join result
+    """
+    cat_keys: List[str] = []
+    c1: Optional[pd.DataFrame] = None
+    c2: Optional[pd.DataFrame] = None
+
+    def _set(k: str, s1: pd.Series, s2: pd.Series) -> None:
+        nonlocal c1, c2
+        if c1 is None or c2 is None:
+            c1, c2 = d1.copy(deep=False), d2.copy(deep=False)
+        c1[k], c2[k] = s1, s2
+
+    for k in keys:
+        s1, s2 = d1[k], d2[k]
+        if is_object_dtype(s1.dtype) and is_object_dtype(s2.dtype):
+            u = union_categoricals([s1.astype("category"), s2.astype("category")])
+            dt = pd.CategoricalDtype(u.categories)
+            _set(k, s1.astype(dt), s2.astype(dt))
+            cat_keys.append(k)
+        elif s1.dtype == np.int64 and s2.dtype == np.int64 and len(s1) > 0 < len(s2):
+            info = np.iinfo(np.int32)
+            lo = min(s1.min(), s2.min())
+            hi = max(s1.max(), s2.max())
+            if lo >= info.min and hi <= info.max:
+                _set(k, s1.astype(np.int32), s2.astype(np.int32))
+    if c1 is None or c2 is None:
+        return d1, d2, cat_keys
+    return c1, c2, cat_keys
+
+
+def _group_map(
+    pdf: pd.DataFrame,
+    keys: List[str],
+    on_group: Callable[[pd.DataFrame], pd.DataFrame],
+    presort_keys: Optional[List[str]] = None,
+    presort_asc: Optional[List[bool]] = None,
+) -> pd.DataFrame:
+    """Apply ``on_group`` to each group of ``pdf`` defined by ``keys``.
+
+    Instead of ``groupby().apply()``, this factorizes the keys, sorts the
+    dataframe once by the group codes (``np.lexsort``, which is stable)
+    and slices it at group boundaries, avoiding pandas per-group
+    disassembly and reassembly overhead. Like ``safe_groupby_apply``,
+    groups with null keys are kept. When ``presort_keys`` is provided,
+    the presort is folded into the same permutation (presort first, then
+    the stable sort on group codes), so no per-group sorting happens.
+
+    :param pdf: pandas DataFrame, must not be empty
+    :param keys: group keys, must not be empty
+    :param on_group: group dataframe in, dataframe out
+    :param presort_keys: columns to sort by within each group, defaults to None
+    :param presort_asc: ascending flags for ``presort_keys``, defaults to None
+    :return: the concatenated output dataframe
+    """
+    # lexsort over the per-key code arrays: compositing the codes into one
+    # array could overflow int64 for multiple high cardinality keys
+    code_cols = [pd.factorize(pdf[k])[0] for k in keys]
+    if presort_keys is not None and len(presort_keys) > 0:
+        tmp = pdf[presort_keys].reset_index(drop=True)
+        perm = tmp.sort_values(
+            presort_keys, ascending=presort_asc, kind="stable"
+        ).index.to_numpy()
+        order = perm[np.lexsort([c[perm] for c in reversed(code_cols)])]
+    else:
+        order = np.lexsort(list(reversed(code_cols)))
+    pdf = pdf.take(order)
+    neq = np.zeros(pdf.shape[0] - 1, dtype=bool)
+    for c in code_cols:
+        neq |= np.diff(c[order]) != 0
+    cuts = (np.flatnonzero(neq) + 1).tolist()
+    blocks = zip([0] + cuts, cuts + [pdf.shape[0]])
+    return pd.concat(
+        [on_group(pdf.iloc[b:e]) for b, e in blocks], ignore_index=True, copy=False
+    )
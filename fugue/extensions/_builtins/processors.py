@@ -1,4 +1,4 @@
-from typing import List, no_type_check, Any
+from typing import Any, Dict, Optional, Tuple, no_type_check
 
 from fugue.collections.partition import PartitionCursor
 from fugue.dataframe import (
@@ -18,6 +18,16 @@ from triad.collections.schema import Schema
 from triad.utils.assertion import assert_or_throw
 from triad.utils.convert import to_instance, to_type
 
+_IGNORE_ERR_CACHE: Dict[Any, type] = {}
+
+
+def _to_error_type(x: Any) -> type:
+    t = _IGNORE_ERR_CACHE.get(x)
+    if t is None:
+        t = to_type(x, Exception)
+        _IGNORE_ERR_CACHE[x] = t
+    return t
+
 
 class RunTransformer(Processor):
     @no_type_check
@@ -31,7 +41,7 @@ class RunTransformer(Processor):
         tf._params = self.params.get("params", ParamDict())  # type: ignore
         tf._partition_spec = self.partition_spec  # type: ignore
         ie = self.params.get("ignore_errors", [])
-        self._ignore_errors = [to_type(x, Exception) for x in ie]
+        self._ignore_errors = tuple(_to_error_type(x) for x in ie)
 
         if isinstance(tf, Transformer):
             return self.transform(df, tf)
@@ -77,10 +87,7 @@ class RunJoin(Processor):
             return dfs[0]
         how = self.params.get_or_throw("how", str)
         on = self.params.get("on", [])
-        df = dfs[0]
-        for i in range(1, len(dfs)):
-            df = self.execution_engine.join(df, dfs[i], how=how, on=on)
-        return df
+        return self.execution_engine.join_many(list(dfs.values()), how=how, on=on)
 
 
 class RunSetOperation(Processor):
@@ -94,6 +101,19 @@ class RunSetOperation(Processor):
             "intersect": self.execution_engine.intersect,
         }[how]
         distinct = self.params.get("distinct", True)
+        if how == "union":
+            # union is associative, reduce as a balanced tree: depth is
+            # O(log N) and distributed engines can run the pairs in parallel
+            items = list(dfs.values())
+            while len(items) > 1:
+                reduced = [
+                    func(a, b, distinct=distinct)
+                    for a, b in zip(items[0::2], items[1::2])
+                ]
+                if len(items) % 2 == 1:
+                    reduced.append(items[-1])
+                items = reduced
+            return items[0]
         df = dfs[0]
         for i in range(1, len(dfs)):
             df = func(df, dfs[i], distinct=distinct)
@@ -159,12 +179,14 @@ class SelectColumns(Processor):
 
 class _TransformerRunner(object):
     def __init__(
-        self, df: DataFrame, transformer: Transformer, ignore_errors: List[type]
+        self, df: DataFrame, transformer: Transformer, ignore_errors: Tuple[type, ...]
     ):
         self.schema = df.schema
         self.metadata = df.metadata
         self.transformer = transformer
-        self.ignore_errors = tuple(ignore_errors)
+        self.ignore_errors = ignore_errors
+        self._empty: Optional[ArrayDataFrame] = None
+        self._cursor_cache: Dict[int, PartitionCursor] = {}
 
     def run(self, cursor: PartitionCursor, df: LocalDataFrame) -> LocalDataFrame:
         self.transformer._cursor = cursor  # type: ignore
@@ -175,25 +197,34 @@ class _TransformerRunner(object):
             try:
                 return to_local_bounded_df(self.transformer.transform(df))
             except self.ignore_errors:  # type: ignore
-                return ArrayDataFrame([], self.transformer.output_schema)
+                if self._empty is None:
+                    self._empty = ArrayDataFrame([], self.transformer.output_schema)
+                return self._empty
 
     def on_init(self, partition_no: int, df: DataFrame) -> None:
-        s = self.transformer.partition_spec
-        self.transformer._cursor = s.get_cursor(  # type: ignore
-            self.schema, partition_no
-        )
+        cursor = self._cursor_cache.get(partition_no)
+        if cursor is None:
+            s = self.transformer.partition_spec
+            cursor = s.get_cursor(self.schema, partition_no)
+            self._cursor_cache[partition_no] = cursor
+        self.transformer._cursor = cursor  # type: ignore
         df._metadata = self.metadata
         self.transformer.on_init(df)
 
 
 class _CoTransformerRunner(object):
     def __init__(
-        self, df: DataFrame, transformer: CoTransformer, ignore_errors: List[type]
+        self,
+        df: DataFrame,
+        transformer: CoTransformer,
+        ignore_errors: Tuple[type, ...],
     ):
         self.schema = df.schema
         self.metadata = df.metadata
         self.transformer = transformer
-        self.ignore_errors = tuple(ignore_errors)
+        self.ignore_errors = ignore_errors
+        self._empty: Optional[ArrayDataFrame] = None
+        self._cursor_cache: Dict[int, PartitionCursor] = {}
 
     def run(self, cursor: PartitionCursor, dfs: DataFrames) -> LocalDataFrame:
         self.transformer._cursor = cursor  # type: ignore
@@ -204,11 +235,15 @@ class _CoTransformerRunner(object):
             try:
                 return to_local_bounded_df(self.transformer.transform(dfs))
             except self.ignore_errors:  # type: ignore
-                return ArrayDataFrame([], self.transformer.output_schema)
+                if self._empty is None:
+                    self._empty = ArrayDataFrame([], self.transformer.output_schema)
+                return self._empty
 
     def on_init(self, partition_no: int, dfs: DataFrames) -> None:
-        s = self.transformer.partition_spec
-        self.transformer._cursor = s.get_cursor(  # type: ignore
-            self.schema, partition_no
-        )
+        cursor = self._cursor_cache.get(partition_no)
+        if cursor is None:
+            s = self.transformer.partition_spec
+            cursor = s.get_cursor(self.schema, partition_no)
+            self._cursor_cache[partition_no] = cursor
+        self.transformer._cursor = cursor  # type: ignore
         self.transformer.on_init(dfs)
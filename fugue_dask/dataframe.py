@@ -1,9 +1,11 @@
+from threading import RLock
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import dask.dataframe as pd
 import pandas
 from fugue.dataframe import DataFrame, LocalDataFrame, PandasDataFrame
 from fugue.dataframe.dataframe import _input_schema
+from triad.collections.dict import ParamDict
 from triad.collections.schema import Schema
 from triad.utils.assertion import assert_arg_not_none, assert_or_throw
 from fugue_dask._utils import DASK_UTILS
@@ -109,21 +111,34 @@ class DaskDataFrame(DataFrame):
 
     def _select_cols(self, cols: List[Any]) -> DataFrame:
         schema = self.schema.extract(cols)
-        return DaskDataFrame(self.native[schema.names], schema, type_safe=False)
+        return self._shallow_clone(self.native[schema.names], schema)
 
     def peek_array(self) -> Any:
         self.assert_not_empty()
-        return self.as_pandas().iloc[0].values.tolist()
+        for i in range(self.native.npartitions):
+            head = self.native.get_partition(i).head(1, compute=True)
+            if head.shape[0] > 0:
+                # cell by cell access, .values would upcast the whole row
+                # to a common dtype and box it through numpy
+                return [head.iat[0, j] for j in range(head.shape[1])]
+        raise AssertionError("impossible case")  # pragma: no cover
 
     def persist(self, **kwargs: Any) -> "DaskDataFrame":
         self._native = self.native.persist(**kwargs)
         return self
 
     def count(self) -> int:
-        return self.as_pandas().shape[0]
+        return int(self.native.shape[0].compute())
 
     def as_pandas(self) -> pandas.DataFrame:
-        return self.native.compute().reset_index(drop=True)
+        res = self.native.compute()
+        if (
+            isinstance(res.index, pandas.RangeIndex)
+            and res.index.start == 0
+            and res.index.step == 1
+        ):  # already the default index, avoid an O(n) reindex copy
+            return res
+        return res.reset_index(drop=True)
 
     def rename(self, columns: Dict[str, str]) -> "DataFrame":
         try:
@@ -131,7 +146,7 @@ class DaskDataFrame(DataFrame):
         except Exception as e:
             raise FugueDataFrameOperationError(e)
         df = self.native.rename(columns=columns)
-        return DaskDataFrame(df, schema, type_safe=False)
+        return self._shallow_clone(df, schema)
 
     def as_array(
         self, columns: Optional[List[str]] = None, type_safe: bool = False
@@ -148,6 +163,21 @@ class DaskDataFrame(DataFrame):
             type_safe=type_safe,
         )
 
+    def _shallow_clone(self, native: pd.DataFrame, schema: Schema) -> "DaskDataFrame":
+        # bypass __init__ and its validations: the native dataframe is
+        # derived from this one so it's already known to be compatible
+        df = DaskDataFrame.__new__(DaskDataFrame)
+        schema.set_readonly()
+        df._schema = schema
+        df._schema_discovered = True
+        # like all other implementations, derived dataframes don't
+        # inherit metadata
+        df._metadata = ParamDict()
+        df._metadata.set_readonly()
+        df._lazy_schema_lock = RLock()
+        df._native = native
+        return df
+
     def _apply_schema(
         self, pdf: pd.DataFrame, schema: Optional[Schema], type_safe: bool = True
     ) -> Tuple[pd.DataFrame, Schema]:
@@ -160,7 +190,9 @@ class DaskDataFrame(DataFrame):
             pschema = Schema(DASK_UTILS.to_schema(pdf))
             if schema is None or pschema == schema:
                 return pdf, pschema.assert_not_empty()
-            pdf = pdf[schema.assert_not_empty().names]
+            schema = schema.assert_not_empty()
+            if list(pdf.columns) != schema.names:  # reorder only when needed
+                pdf = pdf[schema.names]
         else:  # pdf has no named schema
             schema = _input_schema(schema).assert_not_empty()
             assert_or_throw(
@@ -405,9 +405,8 @@ class SparkExecutionEngine(ExecutionEngine):
         metadata: Any = None,
         on_init: Optional[Callable[[int, DataFrame], Any]] = None,
     ) -> DataFrame:
-        presort = partition_spec.presort
-        presort_keys = list(presort.keys())
-        presort_asc = list(presort.values())
+        presort_keys = partition_spec.presort_keys
+        presort_asc = partition_spec.presort_asc
         output_schema = Schema(output_schema)
         input_schema = df.schema
         on_init_once: Any = (
@@ -363,6 +363,47 @@ class ExecutionEngineTests(object):
             c = e.join(a, b, how="INNER")
             df_eq(c, [[1, 2, 3, 33]], "a:double,b:double,c:int,d:int", throw=True)
 
+        def test__join_many(self):
+            e = self.engine
+            a = e.to_df([[1, 2], [3, 4]], "a:int,b:int")
+            b = e.to_df([[6, 1], [2, 7], [5, 1]], "c:int,a:int")
+            d = e.to_df([[1, 0], [3, 8]], "a:int,d:int")
+            # single dataframe, the input must not be mutated
+            c = e.join_many([a], how="inner", metadata=dict(a=1))
+            df_eq(c, [[1, 2], [3, 4]], "a:int,b:int", metadata=dict(a=1), throw=True)
+            assert {} == a.metadata
+            # 3-way inner join on the same key
+            c = e.join_many([a, b, d], how="inner", on=["a"])
+            df_eq(
+                c,
+                [[1, 2, 6, 0], [1, 2, 5, 0]],
+                "a:int,b:int,c:int,d:int",
+                throw=True,
+            )
+            # null keys never match
+            a1 = e.to_df([[1, 2], [None, 4]], "a:double,b:int")
+            b1 = e.to_df([[1, 5], [None, 6]], "a:double,c:int")
+            d1 = e.to_df([[1, 7], [None, 8]], "a:double,d:int")
+            c = e.join_many([a1, b1, d1], how="inner")
+            df_eq(c, [[1, 2, 5, 7]], "a:double,b:int,c:int,d:int", throw=True)
+            # non-inner joins fall back to pairwise joins
+            a2 = e.to_df([[1, "x"], [3, "y"]], "a:int,b:str")
+            b2 = e.to_df([["xx", 1], ["zz", 5]], "c:str,a:int")
+            d2 = e.to_df([[1, "t"]], "a:int,d:str")
+            c = e.join_many([a2, b2, d2], how="left_outer", on=["a"])
+            df_eq(
+                c,
+                [[1, "x", "xx", "t"], [3, "y", None, None]],
+                "a:int,b:str,c:str,d:str",
+                throw=True,
+            )
+            # keys varying between pairs also fall back
+            a3 = e.to_df([[1, 10], [3, 30]], "a:int,b:int")
+            b3 = e.to_df([[1, 5]], "a:int,c:int")
+            d3 = e.to_df([[10, 9]], "b:int,d:int")
+            c = e.join_many([a3, b3, d3], how="inner")
+            df_eq(c, [[1, 10, 5, 9]], "a:int,b:int,c:int,d:int", throw=True)
+
         def test_union(self):
             e = self.engine
             a = e.to_df([[1, 2, 3], [4, None, 6]], "a:double,b:double,c:int")
@@ -21,7 +21,7 @@ setup(
         "triad>=0.4.0",
         "adagio>=0.2.1",
         "qpd>=0.2.4",
-        "sqlalchemy",
+        "duckdb",
         "pyarrow>=0.15.1",
         "pandas>=1.0.2",
     ],
@@ -31,8 +31,14 @@ def test_partition_spec():
     assert ["a", "b", "c"] == p.partition_by
     assert "0" == p.num_partitions
     assert dict(d=True, e=False) == p.presort
+    assert ["d", "e"] == p.presort_keys
+    assert [True, False] == p.presort_asc
+    assert p.presort_keys is p.presort_keys  # cached
+    assert p.presort_asc is p.presort_asc
     assert "hash" == p.algo
     assert not p.empty
+    assert [] == PartitionSpec().presort_keys
+    assert [] == PartitionSpec().presort_asc
 
     p = PartitionSpec(by=["a", "b", "c"], num=5, presort="d,e desc", algo="EvEN")
     assert ["a", "b", "c"] == p.partition_by
@@ -1,7 +1,10 @@
-from fugue.execution import NativeExecutionEngine
+from fugue.collections.partition import PartitionSpec
+from fugue.dataframe import ArrayDataFrame, DataFrames
+from fugue.execution import DuckDBEngine, NativeExecutionEngine
 from fugue_test.execution_suite import ExecutionEngineTests
 from fugue_test.builtin_suite import BuiltInTests
 from fugue.execution.execution_engine import _get_file_threshold
+from pytest import raises
 
 
 class NativeExecutionEngineTests(ExecutionEngineTests.Tests):
@@ -20,6 +23,33 @@ class NativeExecutionEngineBuiltInTests(BuiltInTests.Tests):
         return e
 
 
+def test_duckdb_engine():
+    e = NativeExecutionEngine()
+    assert isinstance(e.default_sql_engine, DuckDBEngine)
+    a = e.to_df([[1, "x"], [2, "y"]], "a:long,b:str")
+    res = e.default_sql_engine.select(
+        DataFrames(t=a), "SELECT b, a+1 AS a FROM t WHERE a>1"
+    )
+    assert res.schema == "b:str,a:long"
+    assert [["y", 3]] == res.as_array()
+
+
+def test_validate_schemas_conf():
+    def mp(cursor, df):
+        return ArrayDataFrame(df.as_array(), "a:long,b:str")
+
+    e = NativeExecutionEngine()
+    a = e.to_df([[1, "x"]], "a:long,b:str")
+    # schema validation is on by default
+    raises(
+        AssertionError, lambda: e.map(a, mp, "a:long,c:str", PartitionSpec())
+    )
+    e = NativeExecutionEngine({"fugue.validate_schemas": False})
+    res = e.map(a, mp, "a:long,c:str", PartitionSpec())
+    assert res.schema == "a:long,b:str"
+    assert [[1, "x"]] == res.as_array()
+
+
 def test_get_file_threshold():
     assert -1 == _get_file_threshold(None)
     assert -2 == _get_file_threshold(-2)
@@ -1,6 +1,7 @@
 import os
 
 from fugue.dataframe.array_dataframe import ArrayDataFrame
+from fugue.dataframe.iterable_dataframe import IterableDataFrame
 from fugue.dataframe.pandas_dataframe import PandasDataFrame
 from fugue.dataframe.utils import _df_eq as df_eq
 from fugue.exceptions import FugueDataFrameInitError
@@ -118,6 +119,44 @@ def test_csv_io(tmpdir):
         path, columns="b:str,x:double", header=2))
 
 
+def test_load_df_chunked(tmpdir):
+    df1 = PandasDataFrame(
+        [["1", 2, 3], ["4", 5, 6], ["7", 8, 9]], "a:str,b:int,c:long"
+    )
+    path = os.path.join(tmpdir, "a.parquet")
+    save_df(df1, path)
+    actual = load_df(path, chunk_size=2)
+    assert isinstance(actual, IterableDataFrame)
+    assert actual.schema == "a:str,b:int,c:long"
+    assert [["1", 2, 3], ["4", 5, 6], ["7", 8, 9]] == actual.as_array()
+    actual = load_df(path, columns=["c", "a"], chunk_size=2)
+    assert actual.schema == "c:long,a:str"
+    assert [[3, "1"], [6, "4"], [9, "7"]] == actual.as_array()
+    actual = load_df(path, columns="b:int,a:str", chunk_size=2)
+    assert [[2, "1"], [5, "4"], [8, "7"]] == actual.as_array()
+
+    path = os.path.join(tmpdir, "a.csv")
+    save_df(df1, path)
+    actual = load_df(path, columns="a:str,b:int,c:long", chunk_size=2)
+    assert isinstance(actual, IterableDataFrame)
+    assert [["1", 2, 3], ["4", 5, 6], ["7", 8, 9]] == actual.as_array(type_safe=True)
+    # streaming csv requires a schema for columns
+    raises(InvalidOperationError, lambda: load_df(path, chunk_size=2))
+    raises(
+        InvalidOperationError,
+        lambda: load_df(path, columns=["a", "b", "c"], chunk_size=2),
+    )
+    # nulls in int columns survive streaming
+    fs = FileSystem()
+    fs.writetext(os.path.join(str(tmpdir), "b.csv"), "1,x\n,y\n")
+    actual = load_df(os.path.join(tmpdir, "b.csv"), columns="a:int,b:str", chunk_size=1)
+    assert [[1, "x"], [None, "y"]] == actual.as_array(type_safe=True)
+
+    path = os.path.join(tmpdir, "a.json")
+    save_df(df1, path)
+    raises(NotImplementedError, lambda: load_df(path, chunk_size=2))
+
+
 def test_json(tmpdir):
     fs = FileSystem()
     df1 = PandasDataFrame([["1", 2, 3]], "a:str,b:int,c:long")